@@ -1 +1,3 @@
 from . import test_ad_email
+from . import test_ad_ldap
+from . import test_ad_helpers
@@ -16,14 +16,13 @@ class TestADEmail(TransactionCase):
         initial_message_count = len(self.employee.message_ids)
 
         # Send AD credentials email
-        # We mock the actual sending to avoid SMTP errors and just check creation logic if possible
-        # But 'force_send=True' tries to connect.
-        # Let's mock 'ir.mail_server.send_email' to avoid network traffic
+        # By default the email is queued for the mail cron, not sent while the activity is marked done.
+        # Let's mock 'ir.mail_server.send_email' to check nothing goes out synchronously
         with patch('odoo.addons.base.models.ir_mail_server.IrMailServer.send_email') as mock_send:
-            self.employee._send_ad_credentials_email('testuser', 'password123')
+            self.assertTrue(self.employee._send_ad_credentials_email('testuser', 'password123'))
             
-            # Verify send_email was called (meaning logic proceeded)
-            self.assertTrue(mock_send.called)
+            # Verify the email was only queued
+            self.assertFalse(mock_send.called)
 
         # Check if a new message was added to chatter
         # The method _send_ad_credentials_email effectively sends an email.
@@ -38,6 +37,15 @@ class TestADEmail(TransactionCase):
         # We expect 0 new messages in chatter from the email itself
         self.assertEqual(new_message_count, initial_message_count, "The AD credentials email should not be logged in the employee chatter")
 
+    def test_ad_email_force_send(self):
+        # With employee_onboarding.force_send_credentials the email is sent immediately
+        self.env['ir.config_parameter'].sudo().set_param('employee_onboarding.force_send_credentials', 'true')
+        with patch('odoo.addons.base.models.ir_mail_server.IrMailServer.send_email') as mock_send:
+            self.employee._send_ad_credentials_email('testuser', 'password123')
+
+            # Verify send_email was called (meaning logic proceeded)
+            self.assertTrue(mock_send.called)
+
     def test_ad_email_content(self):
         # Verify the email content is correct (though detached)
         # We can't easily find the mail.mail if it's auto-deleted.
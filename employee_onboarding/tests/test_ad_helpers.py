@@ -0,0 +1,49 @@
+import string
+
+from odoo.tests.common import TransactionCase, tagged
+
+
+@tagged('ad_helpers_test')
+class TestADHelpers(TransactionCase):
+    def setUp(self):
+        super().setUp()
+        self.Employee = self.env['hr.employee']
+
+    def test_generate_ad_password_policy(self):
+        classes = (string.ascii_uppercase, string.ascii_lowercase, string.digits, '!@#$%')
+        alphabet = ''.join(classes)
+        passwords = {self.Employee._generate_ad_password() for _ in range(200)}
+        # Drawn from the OS CSPRNG: no repeats
+        self.assertEqual(len(passwords), 200)
+        for password in passwords:
+            self.assertTrue(12 <= len(password) <= 16, password)
+            self.assertTrue(set(password) <= set(alphabet), password)
+            for chars in classes:
+                self.assertTrue(any(c in chars for c in password), f"{password} lacks one of {chars}")
+
+    def test_ldap_escape_dn(self):
+        self.assertEqual(self.Employee._ldap_escape_dn('John Doe'), 'John Doe')
+        self.assertEqual(self.Employee._ldap_escape_dn('Doe, John'), 'Doe\\, John')
+        self.assertEqual(
+            self.Employee._ldap_escape_dn('a\\b,c#d+e;f"g<h>i=j'),
+            'a\\\\b\\,c\\#d\\+e\\;f\\"g\\<h\\>i\\=j',
+        )
+        self.assertEqual(self.Employee._ldap_escape_dn(''), '')
+        self.assertIsNone(self.Employee._ldap_escape_dn(None))
+
+    def test_ldap_escape_filter(self):
+        self.assertEqual(self.Employee._ldap_escape_filter('johndoe'), 'johndoe')
+        self.assertEqual(
+            self.Employee._ldap_escape_filter('x*(y)\\\x00z'),
+            'x\\2a\\28y\\29\\5c\\00z',
+        )
+        self.assertEqual(self.Employee._ldap_escape_filter(''), '')
+        self.assertIsNone(self.Employee._ldap_escape_filter(None))
+
+    def test_ad_config_read_only(self):
+        cfg = self.Employee._get_ad_config()
+        # Cached and shared by every caller: must not be modifiable
+        with self.assertRaises(TypeError):
+            cfg['admin_password'] = 'changed'
+        self.assertIsInstance(cfg['default_groups'], tuple)
+        self.assertIs(self.Employee._get_ad_config(), cfg)
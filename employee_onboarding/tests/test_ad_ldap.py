@@ -0,0 +1,227 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from odoo.tests.common import TransactionCase, tagged
+
+from odoo.addons.employee_onboarding.models.hr_employee import HrEmployee
+
+# Stand-in for the names returned by HrEmployee._import_ldap3 (ldap3 itself is not needed)
+LDAP3 = SimpleNamespace(
+    AUTO_BIND_TLS_BEFORE_BIND='TLS_BEFORE_BIND', FIRST='FIRST', LEVEL='LEVEL',
+    MODIFY_ADD='MODIFY_ADD', MODIFY_REPLACE='MODIFY_REPLACE', NONE='NO_INFO', REUSABLE='REUSABLE',
+    SUBTREE='SUBTREE', Connection=MagicMock(), Server=MagicMock(), ServerPool=MagicMock(), Tls=MagicMock(),
+    LDAPException=type('LDAPException', (Exception,), {}),
+)
+SUCCESS = {'result': 0, 'description': 'success', 'type': 'modifyResponse'}
+GROUP_DN = 'CN=ABC,OU=Groups,DC=employee,DC=local'
+
+
+def search_entry(dn, **attributes):
+    """Search result entry shaped like ldap3's raw output without schema: every attribute is a list."""
+    return {'type': 'searchResEntry', 'dn': dn, 'attributes': attributes, 'raw_attributes': {}}
+
+
+@tagged('ad_ldap_test')
+class TestADLdap(TransactionCase):
+    def setUp(self):
+        super().setUp()
+        self.employee = self.env['hr.employee'].create({
+            'name': 'Test Employee',
+            'work_email': 'test.employee@example.com',
+        })
+        self.rec = {
+            'id': self.employee.id,
+            'name': 'Test Employee',
+            'work_email': 'test.employee@example.com',
+            'work_phone': False,
+        }
+        self.cfg = dict(
+            self.env['hr.employee']._get_ad_config(),
+            admin_password='secret',
+            default_groups=('ABC',),
+        )
+        self.user_dn = f"CN=Test Employee,{self.cfg['users_ou']}"
+
+        # Pooled (REUSABLE) connection: operations return a message id resolved by get_response
+        self.conn = MagicMock()
+        self.conn.add.return_value = 1
+        self.conn.modify.return_value = 2
+        self.conn.search.return_value = 3
+        self.responses = {
+            1: ([], dict(SUCCESS, type='addResponse')),
+            2: ([], SUCCESS),
+            3: ([], dict(SUCCESS, type='searchResDone')),
+        }
+        self.conn.get_response.side_effect = lambda msg_id: self.responses[msg_id]
+
+        self.startPatcher(patch.object(HrEmployee, '_import_ldap3', return_value=LDAP3))
+        self.startPatcher(patch.object(HrEmployee, '_get_ldap_pool', return_value=self.conn))
+        self.startPatcher(patch.object(self.env.registry, '_ad_group_dn_cache', {}, create=True))
+
+    def test_create_user_adds_default_group_from_batched_search(self):
+        self.conn.extend.standard.paged_search.return_value = [
+            search_entry(GROUP_DN, objectClass=['top', 'group'], sAMAccountName=['ABC']),
+        ]
+
+        ad_username, error, password = self.employee._create_ad_user_ldap(self.cfg, self.rec)
+
+        self.assertFalse(error)
+        self.assertEqual(ad_username, 'testemployee')
+        self.assertTrue(password)
+        self.conn.modify.assert_any_call(GROUP_DN, {'member': [(LDAP3.MODIFY_ADD, [self.user_dn])]})
+        # The group was resolved by the batched search: no dedicated group lookup
+        self.conn.search.assert_not_called()
+
+        # The DN is now cached: the next onboarding only searches for the new account
+        self.conn.extend.standard.paged_search.return_value = []
+        self.employee._create_ad_user_ldap(self.cfg, self.rec)
+        search_filter = self.conn.extend.standard.paged_search.call_args.kwargs['search_filter']
+        self.assertNotIn('ABC', search_filter)
+        self.conn.modify.assert_called_with(GROUP_DN, {'member': [(LDAP3.MODIFY_ADD, [self.user_dn])]})
+
+    def test_create_user_already_exists(self):
+        self.conn.extend.standard.paged_search.return_value = [
+            search_entry(
+                self.user_dn,
+                objectClass=['top', 'person', 'organizationalPerson', 'user'],
+                sAMAccountName=['testemployee'],
+            ),
+        ]
+
+        ad_username, error, password = self.employee._create_ad_user_ldap(self.cfg, self.rec)
+
+        self.assertFalse(ad_username)
+        self.assertFalse(password)
+        self.assertEqual(error, ('user_exists', self.user_dn))
+        self.assertIn(self.user_dn, self.employee._ad_error_message(error))
+        self.conn.add.assert_not_called()
+
+    def test_create_user_verifies_account_enabled(self):
+        self.cfg['ad_verify_uac'] = True
+        self.conn.extend.standard.paged_search.return_value = [
+            search_entry(GROUP_DN, objectClass=['top', 'group'], sAMAccountName=['ABC']),
+        ]
+        self.responses[3] = ([search_entry(self.user_dn, userAccountControl=['512'])], self.responses[3][1])
+
+        ad_username, error, password = self.employee._create_ad_user_ldap(self.cfg, self.rec)
+
+        self.assertFalse(error)
+        self.assertEqual(ad_username, 'testemployee')
+        self.conn.search.assert_called_once()
+
+    def test_create_user_still_disabled(self):
+        self.cfg['ad_verify_uac'] = True
+        self.conn.extend.standard.paged_search.return_value = []
+        self.responses[3] = ([search_entry(self.user_dn, userAccountControl=['514'])], self.responses[3][1])
+
+        ad_username, error, password = self.employee._create_ad_user_ldap(self.cfg, self.rec)
+
+        self.assertFalse(ad_username)
+        self.assertEqual(error, ('still_disabled', 514))
+
+    def test_create_user_password_refused(self):
+        self.conn.extend.standard.paged_search.return_value = []
+        unwilling = {'result': 53, 'description': 'unwillingToPerform', 'type': 'modifyResponse'}
+        self.responses[2] = ([], unwilling)
+
+        with patch('sys.platform', 'linux'):
+            ad_username, error, password = self.employee._create_ad_user_ldap(self.cfg, self.rec)
+
+        self.assertFalse(ad_username)
+        self.assertEqual(error, ('password_failed', unwilling))
+        dn, changes = self.conn.modify.call_args.args
+        self.assertEqual(dn, self.user_dn)
+        self.assertEqual(changes['userAccountControl'], [(LDAP3.MODIFY_REPLACE, [512])])
+        self.assertTrue(changes['unicodePwd'][0][1][0].startswith('"'.encode('utf-16-le')))
+
+    def test_create_user_group_outside_batched_search(self):
+        # Without groups_ou, a group missed by the batched search is looked up in the whole subtree
+        self.conn.extend.standard.paged_search.return_value = []
+        self.responses[3] = ([search_entry(GROUP_DN)], self.responses[3][1])
+
+        ad_username, error, password = self.employee._create_ad_user_ldap(self.cfg, self.rec)
+
+        self.assertFalse(error)
+        search_filter = self.conn.extend.standard.paged_search.call_args.kwargs['search_filter']
+        self.assertIn('(sAMAccountName=ABC)', search_filter)
+        search_kwargs = self.conn.search.call_args.kwargs
+        self.assertEqual(search_kwargs['search_base'], self.cfg['base_dn'])
+        self.assertEqual(search_kwargs['search_scope'], LDAP3.SUBTREE)
+        self.conn.modify.assert_any_call(GROUP_DN, {'member': [(LDAP3.MODIFY_ADD, [self.user_dn])]})
+
+    def test_create_user_group_in_groups_ou(self):
+        # With groups_ou, groups are only searched directly under it, never by the batched search
+        self.cfg['groups_ou'] = 'OU=Groups,DC=employee,DC=local'
+        self.conn.extend.standard.paged_search.return_value = []
+        self.responses[3] = ([search_entry(GROUP_DN)], self.responses[3][1])
+
+        ad_username, error, password = self.employee._create_ad_user_ldap(self.cfg, self.rec)
+
+        self.assertFalse(error)
+        search_filter = self.conn.extend.standard.paged_search.call_args.kwargs['search_filter']
+        self.assertNotIn('ABC', search_filter)
+        search_kwargs = self.conn.search.call_args.kwargs
+        self.assertEqual(search_kwargs['search_base'], self.cfg['groups_ou'])
+        self.assertEqual(search_kwargs['search_scope'], LDAP3.LEVEL)
+        self.conn.modify.assert_any_call(GROUP_DN, {'member': [(LDAP3.MODIFY_ADD, [self.user_dn])]})
+
+    def test_create_users_concurrently(self):
+        employees = self.employee | self.env['hr.employee'].create([
+            {'name': 'Other Employee', 'work_email': 'other.employee@example.com'},
+            {'name': 'Taken Employee', 'work_email': 'taken.employee@example.com'},
+        ])
+        taken_dn = f"CN=Taken Employee,{self.cfg['users_ou']}"
+
+        def paged_search(search_filter, **kwargs):
+            if '(sAMAccountName=takenemployee)' in search_filter:
+                return [search_entry(taken_dn, objectClass=['top', 'user'], sAMAccountName=['takenemployee'])]
+            return [search_entry(GROUP_DN, objectClass=['top', 'group'], sAMAccountName=['ABC'])]
+
+        self.conn.extend.standard.paged_search.side_effect = paged_search
+        self.startPatcher(patch.object(HrEmployee, '_get_ad_config', return_value=self.cfg))
+
+        employees._onboarding_activity_create_ad_done()
+
+        self.assertEqual(employees.mapped('ad_sync_status'), ['success', 'success', 'error'])
+        self.assertEqual(employees.mapped('ad_username'), ['testemployee', 'otheremployee', False])
+        self.assertIn(f"User already exists: {taken_dn}", employees[2].message_ids[0].body)
+
+
+@tagged('ad_ldap_test')
+class TestADLdapPool(TransactionCase):
+    def setUp(self):
+        super().setUp()
+        self.ldap3 = SimpleNamespace(**dict(
+            vars(LDAP3), Connection=MagicMock(side_effect=lambda *args, **kwargs: MagicMock()),
+        ))
+        self.startPatcher(patch.object(HrEmployee, '_import_ldap3', return_value=self.ldap3))
+        self.startPatcher(patch.object(self.env.registry, '_ad_ldap_pool', {}, create=True))
+        self.cfg = dict(self.env['hr.employee']._get_ad_config(), admin_password='secret')
+
+    def test_pool_per_config(self):
+        Employee = self.env['hr.employee']
+        conn = Employee._get_ldap_pool(self.cfg)
+        self.assertIs(Employee._get_ldap_pool(self.cfg), conn)
+
+        other_conn = Employee._get_ldap_pool(dict(self.cfg, admin_password='other'))
+
+        self.assertIsNot(other_conn, conn)
+        # ldap3 shares REUSABLE pools by name across the whole process: each config needs its own
+        pool_names = [call.kwargs['pool_name'] for call in self.ldap3.Connection.call_args_list]
+        self.assertEqual(len(pool_names), 2)
+        self.assertNotEqual(pool_names[0], pool_names[1])
+        for pool_name in pool_names:
+            self.assertIn(self.env.registry.db_name, pool_name)
+            self.assertNotIn('secret', pool_name)
+
+    def test_invalidate_replaced_pool(self):
+        Employee = self.env['hr.employee']
+        conn = Employee._get_ldap_pool(self.cfg)
+        Employee._invalidate_ldap_pool(self.cfg, conn)
+        conn.unbind.assert_called_once()
+
+        # A worker failing on the old connection must not drop the pool rebuilt meanwhile
+        new_conn = Employee._get_ldap_pool(self.cfg)
+        Employee._invalidate_ldap_pool(self.cfg, conn)
+        self.assertIs(Employee._get_ldap_pool(self.cfg), new_conn)
+        new_conn.unbind.assert_not_called()